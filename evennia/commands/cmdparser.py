@@ -178,18 +178,16 @@ def cmdparser(raw_string, cmdset, caller, match_index=None):
             matches = trimmed
 
     if len(matches) > 1:
-        # we still have multiple matches. Sort them by count quality.
-        matches = sorted(matches, key=lambda m: m[3])
-        # only pick the matches with highest count quality
-        quality = [mat[3] for mat in matches]
-        matches = matches[-quality.count(quality[-1]) :]
+        # we still have multiple matches. Only pick the matches with highest
+        # count quality (keeping their order); no need to sort them for this.
+        quality = max(match[3] for match in matches)
+        matches = [match for match in matches if match[3] == quality]
 
     if len(matches) > 1:
-        # still multiple matches. Fall back to ratio-based quality.
-        matches = sorted(matches, key=lambda m: m[4])
-        # only pick the highest rated ratio match
-        quality = [mat[4] for mat in matches]
-        matches = matches[-quality.count(quality[-1]) :]
+        # still multiple matches. Fall back to ratio-based quality and
+        # only pick the highest rated ratio match.
+        quality = max(match[4] for match in matches)
+        matches = [match for match in matches if match[4] == quality]
 
     if len(matches) > 1 and match_index is not None:
         # We couldn't separate match by quality, but we have an
@@ -26,6 +26,7 @@ Set theory.
     to affect the low-priority cmdset.  Ex: A1,A3 + B1,B2,B4,B5 = B2,B4,B5
 
 """
+from itertools import chain
 from weakref import WeakKeyDictionary
 
 from django.utils.translation import gettext as _
@@ -182,6 +183,13 @@ class CmdSet(object, metaclass=_CmdSetMeta):
     persistent = False
     key_mergetypes = {}
     errmessage = ""
+    # the methods performing each mergetype. Unknown mergetypes use Union.
+    _merge_methods = {
+        "Union": "_union",
+        "Intersect": "_intersect",
+        "Replace": "_replace",
+        "Remove": "_remove",
+    }
     # pre-store properties to duplicate straight off
     to_duplicate = (
         "key",
@@ -244,10 +252,14 @@ class CmdSet(object, metaclass=_CmdSetMeta):
         cmdset_c = cmdset_a._duplicate()
         # we make copies, not refs by use of [:]
         cmdset_c.commands = cmdset_a.commands[:]
-        if cmdset_a.duplicates and cmdset_a.priority == cmdset_b.priority:
+        if not cmdset_a.commands:
+            # nothing in A to replace commands in B with
             cmdset_c.commands.extend(cmdset_b.commands)
-        else:
-            cmdset_c.commands.extend([cmd for cmd in cmdset_b if cmd not in cmdset_a])
+        elif cmdset_a.duplicates and cmdset_a.priority == cmdset_b.priority:
+            cmdset_c.commands.extend(cmdset_b.commands)
+        elif cmdset_b.commands:
+            names_a = cmdset_a._get_cmd_names()
+            cmdset_c.commands.extend([cmd for cmd in cmdset_b if names_a.isdisjoint(cmd._matchset)])
         return cmdset_c
 
     def _intersect(self, cmdset_a, cmdset_b):
@@ -269,12 +281,16 @@ class CmdSet(object, metaclass=_CmdSetMeta):
 
         """
         cmdset_c = cmdset_a._duplicate()
+        if not cmdset_a.commands or not cmdset_b.commands:
+            # no commands can be in both sets
+            return cmdset_c
+        names_b = cmdset_b._get_cmd_names()
         if cmdset_a.duplicates and cmdset_a.priority == cmdset_b.priority:
-            for cmd in [cmd for cmd in cmdset_a if cmd in cmdset_b]:
+            for cmd in [cmd for cmd in cmdset_a if not names_b.isdisjoint(cmd._matchset)]:
                 cmdset_c.add(cmd)
                 cmdset_c.add(cmdset_b.get(cmd))
         else:
-            cmdset_c.commands = [cmd for cmd in cmdset_a if cmd in cmdset_b]
+            cmdset_c.commands = [cmd for cmd in cmdset_a if not names_b.isdisjoint(cmd._matchset)]
         return cmdset_c
 
     def _replace(self, cmdset_a, cmdset_b):
@@ -313,9 +329,33 @@ class CmdSet(object, metaclass=_CmdSetMeta):
         """
 
         cmdset_c = cmdset_a._duplicate()
-        cmdset_c.commands = [cmd for cmd in cmdset_b if cmd not in cmdset_a]
+        if cmdset_a.commands:
+            names_a = cmdset_a._get_cmd_names()
+            cmdset_c.commands = [cmd for cmd in cmdset_b if names_a.isdisjoint(cmd._matchset)]
+        else:
+            # nothing to filter out
+            cmdset_c.commands = cmdset_b.commands[:]
         return cmdset_c
 
+    def _get_cmd_names(self):
+        """
+        Get the keys and aliases of all commands in this cmdset.
+
+        Returns:
+            names (set): All keys and aliases in the set.
+
+        Notes:
+            Two commands are considered equal if they share any key or alias. Checking
+            a command's `_matchset` against this set is thus the same as checking
+            `cmd in cmdset`, but without comparing to every command in turn. This
+            is used to speed up the merge operations.
+
+        """
+        names = set()
+        for cmd in self.commands:
+            names.update(cmd._matchset)
+        return names
+
     def _instantiate(self, cmd):
         """
         checks so that object is an instantiated command and not, say
@@ -415,76 +455,52 @@ class CmdSet(object, metaclass=_CmdSetMeta):
         if not cmdset_a:
             return self
 
-        sys_commands_a = cmdset_a.get_system_cmds()
-        sys_commands_b = self.get_system_cmds()
-
         if self.priority <= cmdset_a.priority:
             # A higher or equal priority to B
-
-            # preserve system __commands
-            sys_commands = sys_commands_a + [
-                cmd for cmd in sys_commands_b if cmd not in sys_commands_a
-            ]
-
-            mergetype = cmdset_a.key_mergetypes.get(self.key, cmdset_a.mergetype)
-            if mergetype == "Intersect":
-                cmdset_c = self._intersect(cmdset_a, self)
-            elif mergetype == "Replace":
-                cmdset_c = self._replace(cmdset_a, self)
-            elif mergetype == "Remove":
-                cmdset_c = self._remove(cmdset_a, self)
-            else:  # Union
-                cmdset_c = self._union(cmdset_a, self)
-
-            # pass through options whenever they are set, unless the merging or higher-prio
-            # set changes the setting (i.e. has a non-None value). We don't pass through
-            # the duplicates setting; that is per-merge; the resulting .duplicates value
-            # is always None (so merging cmdsets must all have explicit values if wanting
-            # to cause duplicates).
-            cmdset_c.no_channels = (
-                self.no_channels if cmdset_a.no_channels is None else cmdset_a.no_channels
-            )
-            cmdset_c.no_exits = self.no_exits if cmdset_a.no_exits is None else cmdset_a.no_exits
-            cmdset_c.no_objs = self.no_objs if cmdset_a.no_objs is None else cmdset_a.no_objs
-            cmdset_c.duplicates = None
-
+            cmdset_high, cmdset_low = cmdset_a, self
         else:
             # B higher priority than A
-
-            # preserver system __commands
-            sys_commands = sys_commands_b + [
-                cmd for cmd in sys_commands_a if cmd not in sys_commands_b
-            ]
-
-            mergetype = self.key_mergetypes.get(cmdset_a.key, self.mergetype)
-            if mergetype == "Intersect":
-                cmdset_c = self._intersect(self, cmdset_a)
-            elif mergetype == "Replace":
-                cmdset_c = self._replace(self, cmdset_a)
-            elif mergetype == "Remove":
-                cmdset_c = self._remove(self, cmdset_a)
-            else:  # Union
-                cmdset_c = self._union(self, cmdset_a)
-
-            # pass through options whenever they are set, unless the higher-prio
-            # set changes the setting (i.e. has a non-None value). We don't pass through
-            # the duplicates setting; that is per-merge; the resulting .duplicates value#
-            # is always None (so merging cmdsets must all have explicit values if wanting
-            # to cause duplicates).
-            cmdset_c.no_channels = (
-                cmdset_a.no_channels if self.no_channels is None else self.no_channels
-            )
-            cmdset_c.no_exits = cmdset_a.no_exits if self.no_exits is None else self.no_exits
-            cmdset_c.no_objs = cmdset_a.no_objs if self.no_objs is None else self.no_objs
-            cmdset_c.duplicates = None
+            cmdset_high, cmdset_low = self, cmdset_a
+
+        mergetype = cmdset_high.key_mergetypes.get(cmdset_low.key, cmdset_high.mergetype)
+        merge_method = getattr(self, self._merge_methods.get(mergetype, "_union"))
+        cmdset_c = merge_method(cmdset_high, cmdset_low)
+
+        # pass through options whenever they are set, unless the higher-prio
+        # set changes the setting (i.e. has a non-None value). We don't pass through
+        # the duplicates setting; that is per-merge; the resulting .duplicates value
+        # is always None (so merging cmdsets must all have explicit values if wanting
+        # to cause duplicates).
+        cmdset_c.no_channels = (
+            cmdset_low.no_channels if cmdset_high.no_channels is None else cmdset_high.no_channels
+        )
+        cmdset_c.no_exits = (
+            cmdset_low.no_exits if cmdset_high.no_exits is None else cmdset_high.no_exits
+        )
+        cmdset_c.no_objs = (
+            cmdset_low.no_objs if cmdset_high.no_objs is None else cmdset_high.no_objs
+        )
+        cmdset_c.duplicates = None
 
         # we store actual_mergetype since key_mergetypes
         # might be different from the main mergetype.
         # This is used for diagnosis.
         cmdset_c.actual_mergetype = mergetype
 
-        # print "__add__ for %s (prio %i)  called with %s (prio %i)." % (self.key, self.priority,
-        # cmdset_a.key, cmdset_a.priority)
+        # preserve system __commands; the higher-prio ones replace same-named
+        # ones from the lower-prio cmdset
+        sys_commands_high = cmdset_high.get_system_cmds()
+        sys_names_high = set()
+        for cmd in sys_commands_high:
+            sys_names_high.update(cmd._matchset)
+        sys_commands = chain(
+            sys_commands_high,
+            (
+                cmd
+                for cmd in cmdset_low.get_system_cmds()
+                if sys_names_high.isdisjoint(cmd._matchset)
+            ),
+        )
 
         # return the system commands to the cmdset
         cmdset_c.add(sys_commands, allow_duplicates=True)
@@ -545,23 +561,32 @@ class CmdSet(object, metaclass=_CmdSetMeta):
             if not hasattr(cmd, "obj") or cmd.obj is None:
                 cmd.obj = self.cmdsetobj
 
-            # remove duplicates and add new
-            for _dum in range(commands.count(cmd)):
-                commands.remove(cmd)
+            # remove duplicates and add new. We filter in one pass rather than
+            # count+remove, which would rescan and shift the list for every match
+            commands = [oldcmd for oldcmd in commands if oldcmd != cmd]
             commands.append(cmd)
 
             # add system_command to separate list as well,
             # for quick look-up. These have no
             if cmd.key.startswith("__"):
                 # remove same-matches and add new
-                for _dum in range(system_commands.count(cmd)):
-                    system_commands.remove(cmd)
+                system_commands = [oldcmd for oldcmd in system_commands if oldcmd != cmd]
                 system_commands.append(cmd)
 
         if not allow_duplicates:
-            # extra run to make sure to avoid doublets
-            commands = list(set(commands))
+            # extra run to make sure to avoid doublets. Commands are equal if they
+            # share a key or alias and all hash the same, so rather than going
+            # through set() (which would compare every pair) we keep track of the
+            # names seen so far. This also preserves the order of the commands.
+            seen = set()
+            unique = []
+            for cmd in commands:
+                if seen.isdisjoint(cmd._matchset):
+                    seen.update(cmd._matchset)
+                    unique.append(cmd)
+            commands = unique
         self.commands = commands
+        self.system_commands = system_commands
 
     def remove(self, cmd):
         """
@@ -687,12 +712,9 @@ class CmdSet(object, metaclass=_CmdSetMeta):
                 the `call` locktype check.
 
         """
-        names = []
         if caller:
-            [names.extend(cmd._keyaliases) for cmd in self.commands if cmd.access(caller)]
-        else:
-            [names.extend(cmd._keyaliases) for cmd in self.commands]
-        return names
+            return [name for cmd in self.commands if cmd.access(caller) for name in cmd._keyaliases]
+        return [name for cmd in self.commands for name in cmd._keyaliases]
 
     def at_cmdset_creation(self):
         """
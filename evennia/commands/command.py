@@ -18,6 +18,13 @@ from evennia.utils.utils import fill, is_iter, lazy_property, make_iter
 
 CMD_IGNORE_PREFIXES = settings.CMD_IGNORE_PREFIXES
 
+# The stock arg_regex only looks at the first character of the arguments (or
+# that there are no arguments at all). Commands using it skip the regex engine
+# in `Command.match` and do a plain character membership test instead.
+_SIMPLE_ARG_REGEX_PATTERN = r"^[ /]|\n|$"
+_SIMPLE_ARG_REGEX = re.compile(_SIMPLE_ARG_REGEX_PATTERN, re.I + re.UNICODE)
+_SIMPLE_ARG_SEPARATORS = frozenset(" /\n")
+
 
 class InterruptCommand(Exception):
 
@@ -82,7 +89,10 @@ def _init_command(cls, **kwargs):
     cls.lock_storage = ";".join(temp)
 
     if hasattr(cls, "arg_regex") and isinstance(cls.arg_regex, str):
-        cls.arg_regex = re.compile(r"%s" % cls.arg_regex, re.I + re.UNICODE)
+        if cls.arg_regex == _SIMPLE_ARG_REGEX_PATTERN:
+            cls.arg_regex = _SIMPLE_ARG_REGEX
+        else:
+            cls.arg_regex = re.compile(r"%s" % cls.arg_regex, re.I + re.UNICODE)
     if not hasattr(cls, "auto_help"):
         cls.auto_help = True
     if not hasattr(cls, "is_exit"):
@@ -251,8 +261,9 @@ class Command(metaclass=CommandMeta):
 
         """
         try:
-            # first assume input is a command (the most common case)
-            return self._matchset.intersection(cmd._matchset)
+            # first assume input is a command (the most common case). Checking
+            # for overlap with isdisjoint avoids building an intersection set.
+            return not self._matchset.isdisjoint(cmd._matchset)
         except AttributeError:
             # probably got a string
             return cmd in self._matchset
@@ -313,6 +324,8 @@ class Command(metaclass=CommandMeta):
         self._keyaliases = tuple(sorted(matches, key=len, reverse=True))
 
         self._noprefix_aliases = {x.lstrip(CMD_IGNORE_PREFIXES): x for x in self._keyaliases}
+        # tuple of the above keys, for quickly discarding non-matches in `match`
+        self._noprefix_keys = tuple(self._noprefix_aliases)
 
     def set_key(self, new_key):
         """
@@ -366,20 +379,41 @@ class Command(metaclass=CommandMeta):
             result (bool): Match result.
 
         """
+        # most commands will not match at all, so we first check all keys/aliases
+        # in one go before looking for which one matched.
         if include_prefixes:
+            if not cmdname.startswith(self._keyaliases):
+                return None, None
             for cmd_key in self._keyaliases:
-                if cmdname.startswith(cmd_key) and (
-                    not self.arg_regex or self.arg_regex.match(cmdname[len(cmd_key) :])
-                ):
+                if cmdname.startswith(cmd_key) and self._match_args(cmdname[len(cmd_key) :]):
                     return cmd_key, cmd_key
         else:
+            if not cmdname.startswith(self._noprefix_keys):
+                return None, None
             for k, v in self._noprefix_aliases.items():
-                if cmdname.startswith(k) and (
-                    not self.arg_regex or self.arg_regex.match(cmdname[len(k) :])
-                ):
+                if cmdname.startswith(k) and self._match_args(cmdname[len(k) :]):
                     return k, v
         return None, None
 
+    def _match_args(self, args):
+        """
+        Check the part of the input following a matched key/alias against `arg_regex`.
+
+        Args:
+            args (str): The input string following the matched key or alias.
+
+        Returns:
+            result (bool): If the arguments are acceptable for this command.
+
+        """
+        arg_regex = self.arg_regex
+        if not arg_regex:
+            return True
+        if arg_regex is _SIMPLE_ARG_REGEX:
+            # equivalent to the regex, without invoking the regex engine
+            return not args or args[0] in _SIMPLE_ARG_SEPARATORS
+        return bool(arg_regex.match(args))
+
     def access(self, srcobj, access_type="cmd", default=False):
         """
         This hook is called by the cmdhandler to determine if srcobj
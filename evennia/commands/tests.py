@@ -44,6 +44,14 @@ class _CmdEf(_BaseCmd):
     aliases = ["ff"]
 
 
+class _CmdSysNoInput(_BaseCmd):
+    key = "__noinput_command"
+
+
+class _CmdSysNoMatch(_BaseCmd):
+    key = "__nomatch_command"
+
+
 class _CmdSetA(CmdSet):
     key = "A"
 
@@ -169,6 +177,34 @@ class TestCmdSetMergers(TestCase):
         self.assertEqual(sum(1 for cmd in cmdset_f.commands if cmd.from_cmdset == "A"), 2)
         self.assertEqual(sum(1 for cmd in cmdset_f.commands if cmd.from_cmdset == "C"), 0)
 
+    def test_empty(self):
+        a, empty = self.cmdset_a, CmdSet()
+        for mergetype, num_cmds in (("Union", 4), ("Intersect", 0), ("Remove", 4)):
+            empty.mergetype = mergetype
+            cmdset_f = a + empty  # same-prio. Empty cmdset's mergetype kicks in
+            self.assertEqual(len(cmdset_f.commands), num_cmds)
+            self.assertEqual(cmdset_f.key, empty.key)
+        empty.mergetype = "Replace"
+        cmdset_f = a + empty
+        self.assertEqual(len(cmdset_f.commands), 0)
+        cmdset_f = empty + a  # same-prio. A's Union kicks in
+        self.assertEqual(len(cmdset_f.commands), 4)
+        self.assertEqual(cmdset_f.key, "A")
+
+    def test_system_commands(self):
+        a, c = self.cmdset_a, self.cmdset_c
+        a.add(_CmdSysNoInput("A"))
+        c.add(_CmdSysNoInput("C"))
+        c.add(_CmdSysNoMatch("C"))
+        a.priority = 1
+        a.mergetype = "Replace"
+        cmdset_f = a + c  # high prio A. System commands survive Replace
+        self.assertEqual(len(cmdset_f.commands), 6)
+        self.assertEqual(
+            sorted((cmd.key, cmd.from_cmdset) for cmd in cmdset_f.get_system_cmds()),
+            [("__noinput_command", "A"), ("__nomatch_command", "C")],
+        )
+
     def test_order(self):
         "Merge in reverse- and forward orders, same priorities"
         a, b, c, d = self.cmdset_a, self.cmdset_b, self.cmdset_c, self.cmdset_d
@@ -1189,6 +1225,56 @@ class TestCmdParser(TestCase):
             [("test1", "hello", bcmd, 5, 0.5, "test1")],
         )
 
+    def test_cmdparser_longest_match(self):
+        class _CmdLook(AccessableCommand):
+            key = "look"
+            arg_regex = None
+
+        class _CmdLookAt(AccessableCommand):
+            key = "look at"
+            arg_regex = None
+
+        a_cmdset = CmdSet()
+        a_cmdset.add([_CmdLook, _CmdLookAt])
+        bcmd = [cmd for cmd in a_cmdset.commands if cmd.key == "look at"][0]
+
+        self.assertEqual(
+            cmdparser.cmdparser("look at me", a_cmdset, None),
+            [("look at", " me", bcmd, 7, 0.7, "look at")],
+        )
+
+
+class _CmdArgRegexDefault(AccessableCommand):
+    key = "test1"
+    arg_regex = r"^[ /]|\n|$"
+
+
+class _CmdArgRegexCustom(AccessableCommand):
+    key = "test1"
+    arg_regex = r"^\s+\d"
+
+
+class TestCmdArgRegex(TestCase):
+    """
+    Test the matching of arguments against Command.arg_regex.
+
+    """
+
+    def test_default_arg_regex(self):
+        cmd = _CmdArgRegexDefault()
+        self.assertEqual(cmd.match("test1"), ("test1", "test1"))
+        self.assertEqual(cmd.match("test1 rock"), ("test1", "test1"))
+        self.assertEqual(cmd.match("test1/switch"), ("test1", "test1"))
+        self.assertEqual(cmd.match("test1\nrock"), ("test1", "test1"))
+        self.assertEqual(cmd.match("test1rock"), (None, None))
+        self.assertEqual(cmd.match("test1\trock"), (None, None))
+
+    def test_custom_arg_regex(self):
+        cmd = _CmdArgRegexCustom()
+        self.assertEqual(cmd.match("test1 12"), ("test1", "test1"))
+        self.assertEqual(cmd.match("test1 rock"), (None, None))
+        self.assertEqual(cmd.match("test1"), (None, None))
+
 
 class TestCmdSetNesting(BaseEvenniaTest):
     """
@@ -1231,6 +1317,38 @@ class TestCmdSet(BaseEvenniaTest):
 
         self.assertIsInstance(result, _CmdTest2)
 
+    def test_cmdset_get_all_cmd_keys_and_aliases(self):
+        test_cmd_set = _CmdSetTest()
+        test_cmd_set.add(_CmdG)
+
+        self.assertEqual(
+            sorted(test_cmd_set.get_all_cmd_keys_and_aliases()),
+            ["&the third command", "another command", "grin", "grin at"]
+            + ["smile", "smile at", "test1"],
+        )
+
+    def test_cmdset_add_keeps_order(self):
+        test_cmd_set = _CmdSetTest()
+        test_cmd_set.add(_CmdTest4)
+        test_cmd_set.add(_CmdTest1)
+
+        self.assertEqual(
+            [cmd.key for cmd in test_cmd_set.commands],
+            ["another command", "&the third command", "test2", "test1"],
+        )
+
+    def test_cmdset_add_removes_duplicates(self):
+        test_cmd_set = _CmdSetTest()
+        # merges with duplicates=True may leave same-named commands in the set
+        test_cmd_set.commands.append(_CmdTest1())
+        self.assertEqual(test_cmd_set.count(), 4)
+
+        test_cmd_set.add(_CmdTest4)
+        self.assertEqual(
+            [cmd.key for cmd in test_cmd_set.commands],
+            ["test1", "another command", "&the third command", "test2"],
+        )
+
 
 class _CmdG(Command):
     key = "smile"